@@ -5,9 +5,6 @@ from typing import Optional
 
 import typer
 
-from paper_bartender.services.decomposition import DecompositionService
-from paper_bartender.services.milestone_service import MilestoneService
-from paper_bartender.services.paper_service import PaperService
 from paper_bartender.utils.dates import format_date, parse_date
 from paper_bartender.utils.display import (
     console,
@@ -42,6 +39,8 @@ def add_paper(
     ),
 ) -> None:
     """Add a new paper with a deadline and optional PDF."""
+    from paper_bartender.cli.deps import Container
+
     try:
         deadline_date = parse_date(deadline)
     except ValueError as e:
@@ -60,7 +59,7 @@ def add_paper(
             raise typer.Exit(1)
         pdf_path = str(path)
 
-    paper_service = PaperService()
+    paper_service = Container().paper_service
     try:
         paper = paper_service.create(
             name=name,
@@ -111,19 +110,21 @@ def add_milestone(
     ),
 ) -> None:
     """Add a milestone to a paper and automatically generate daily tasks."""
+    from paper_bartender.cli.deps import Container
+
     try:
         due_date = parse_date(due)
     except ValueError as e:
         print_error(str(e))
         raise typer.Exit(1)
 
-    paper_service = PaperService()
-    paper = paper_service.get_by_name(paper_name)
+    container = Container()
+    paper = container.paper_service.get_by_name(paper_name)
     if paper is None:
         print_error(f'Paper "{paper_name}" not found')
         raise typer.Exit(1)
 
-    milestone_service = MilestoneService()
+    milestone_service = container.milestone_service
     try:
         milestone = milestone_service.create(
             paper_id=paper.id,
@@ -139,7 +140,7 @@ def add_milestone(
         # Auto-decompose the milestone unless --no-decompose is set
         if not no_decompose:
             try:
-                decomposition_service = DecompositionService()
+                decomposition_service = container.decomposition_service
                 with console.status('Generating daily tasks...'):
                     tasks = decomposition_service.decompose_milestone(milestone.id)
                 print_success(f'Generated {len(tasks)} daily tasks:')
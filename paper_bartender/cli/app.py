@@ -1,18 +1,15 @@
 """Main CLI application for paper-bartender."""
 
+import re
 from datetime import date
+from itertools import groupby
+from operator import attrgetter
 from typing import Dict, List, Optional
+from uuid import UUID
 
 import typer
 
-from paper_bartender.cli.add import add_app
-from paper_bartender.cli.delete import delete_app
-from paper_bartender.cli.list import list_app
 from paper_bartender.models.task import Task
-from paper_bartender.services.decomposition import DecompositionService
-from paper_bartender.services.paper_service import PaperService
-from paper_bartender.services.task_service import TaskService
-from paper_bartender.storage.json_store import JsonStore
 from paper_bartender.utils.dates import format_date
 from paper_bartender.utils.display import (
     console,
@@ -21,7 +18,6 @@ from paper_bartender.utils.display import (
     print_info,
     print_success,
     print_warning,
-    status_style,
 )
 
 app = typer.Typer(
@@ -30,9 +26,47 @@ app = typer.Typer(
     no_args_is_help=False,
 )
 
-app.add_typer(add_app, name='add')
-app.add_typer(delete_app, name='delete')
-app.add_typer(list_app, name='list')
+
+# Commands defined directly on the root app; when one of these is being
+# invoked, the add/delete/list sub-apps are never reached and their modules
+# don't need to be imported or registered at all.
+_ROOT_COMMANDS = frozenset(
+    {'today', 'all', 'timeline', 'decompose', 'done', 'skip', 'clear', 'restore', 'do'}
+)
+
+# Rich table rendering cost grows with every cell; past this many rows the
+# colored tables stop being readable anyway, so fall back to plain output
+_MAX_INTERACTIVE_ROWS = 200
+
+# Matches decomposed task descriptions like "[40% of 'Run ablations'] ..."
+_CHECKPOINT_RE = re.compile(r"\[(\d+)% of '([^']+)'\](.*)")
+
+
+def _register_subcommands() -> None:
+    """Register sub-apps, importing them only when registration happens.
+
+    Keeping these imports out of module scope means `--help` and simple
+    commands don't pay for the sub-apps' transitive service imports. As a
+    further shortcut, invocations of a known root command (`today`,
+    `decompose`, ...) skip sub-app registration entirely; anything else —
+    `--help`, a sub-app name, or an unrecognized argv (e.g. when driven by
+    a test runner) — registers everything so help and dispatch stay complete.
+    """
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] in _ROOT_COMMANDS:
+        return
+
+    from paper_bartender.cli.add import add_app
+    from paper_bartender.cli.delete import delete_app
+    from paper_bartender.cli.list import list_app
+
+    app.add_typer(add_app, name='add')
+    app.add_typer(delete_app, name='delete')
+    app.add_typer(list_app, name='list')
+
+
+_register_subcommands()
 
 
 @app.callback(invoke_without_command=True)
@@ -82,15 +116,34 @@ def timeline(
     """Show the complete timeline for a specific paper."""
     show_upcoming(paper_name=paper_name)
 
+def _print_plain(tasks: List[Task], paper_names: Dict[UUID, str]) -> None:
+    """Emit tasks as tab-separated lines, bypassing Rich entirely.
+
+    Used for very large listings where table markup would dominate the
+    runtime; the format is also friendlier to pipelines and grep.
+    """
+    import sys
+
+    out = sys.stdout
+    for task in tasks:
+        p_name = paper_names.get(task.paper_id, 'Unknown')
+        out.write(
+            f'{task.scheduled_date.isoformat()}\t{p_name}\t'
+            f'{task.status.value}\t{task.description}\n'
+        )
+
+
 def show_today(paper_name: Optional[str] = None) -> None:
     """Display today's tasks."""
-    import re
+    from rich.console import Group, RenderableType
+
+    from paper_bartender.cli.deps import Container
     from paper_bartender.utils.display import get_paper_color
-    from paper_bartender.services.milestone_service import MilestoneService
 
-    task_service = TaskService()
-    paper_service = PaperService()
-    milestone_service = MilestoneService()
+    container = Container()
+    task_service = container.task_service
+    paper_service = container.paper_service
+    milestone_service = container.milestone_service
 
     # Get paper filter if specified
     paper_id = None
@@ -107,9 +160,6 @@ def show_today(paper_name: Optional[str] = None) -> None:
         print_warning(f'You have {len(overdue)} overdue task(s)!')
         console.print()
 
-    # Get paper names for display
-    paper_names = task_service.get_paper_name_map()
-
     # Build milestone due date cache
     milestone_due_dates: Dict[str, date] = {}
 
@@ -121,6 +171,15 @@ def show_today(paper_name: Optional[str] = None) -> None:
         print_info("No tasks scheduled for today. Use 'paper-bartender all' to see upcoming progress.")
         return
 
+    # Get paper names for display; fetched once here and shared by both the
+    # overdue and today tables so the empty path above skips the store read
+    paper_names = task_service.get_paper_name_map()
+
+    # Very large listings skip the Rich tables entirely
+    if len(overdue) + len(tasks) > _MAX_INTERACTIVE_ROWS:
+        _print_plain(overdue + tasks, paper_names)
+        return
+
     # Show paper deadlines summary
     paper_ids_in_tasks = set(t.paper_id for t in tasks)
     if overdue:
@@ -137,7 +196,8 @@ def show_today(paper_name: Optional[str] = None) -> None:
     papers_with_deadlines.sort(key=lambda x: x[1])
 
     if papers_with_deadlines:
-        console.print('[bold]📌 Paper Deadlines:[/bold]')
+        # Build the summary as one string so Rich parses and flushes once
+        summary_lines = ['[bold]📌 Paper Deadlines:[/bold]']
         for p_name, deadline, days_left in papers_with_deadlines:
             if days_left < 0:
                 days_str = f'[red]{abs(days_left)} days overdue[/red]'
@@ -147,8 +207,9 @@ def show_today(paper_name: Optional[str] = None) -> None:
                 days_str = f'[yellow]{days_left} days left[/yellow]'
             else:
                 days_str = f'[green]{days_left} days left[/green]'
-            console.print(f'  • {p_name}: {deadline.strftime("%a, %b %d, %Y")} ({days_str})')
-        console.print()
+            summary_lines.append(f'  • {p_name}: {deadline.strftime("%a, %b %d, %Y")} ({days_str})')
+        summary_lines.append('')
+        console.print('\n'.join(summary_lines))
 
     # Track paper colors
     paper_colors: Dict[str, str] = {}
@@ -238,7 +299,7 @@ def show_today(paper_name: Optional[str] = None) -> None:
         milestone_due = get_milestone_due(task)
 
         # Extract percentage and milestone from task description
-        match = re.match(r'\[(\d+)% of \'([^\']+)\'\](.*)', task.description)
+        match = _CHECKPOINT_RE.match(task.description)
         if match:
             pct = int(match.group(1))
             milestone = match.group(2)
@@ -269,31 +330,34 @@ def show_today(paper_name: Optional[str] = None) -> None:
             detailed_task,
         )
 
-    # Show overdue tasks first
+    # Render overdue and today's tables in a single print
+    renderables: List[RenderableType] = []
     if overdue:
         overdue_table = create_tasks_table(title='⚠️  Overdue Tasks')
         for task in overdue:
             overdue_table.add_row(*format_task_row(task, is_overdue=True))
-        console.print(overdue_table)
-        console.print()
+        renderables.append(overdue_table)
+        renderables.append('')
 
-    # Show today's tasks
     if tasks:
         table = create_tasks_table(title=title)
         for task in tasks:
             table.add_row(*format_task_row(task))
-        console.print(table)
+        renderables.append(table)
+
+    if renderables:
+        console.print(Group(*renderables))
 
 
 def show_upcoming(paper_name: Optional[str] = None) -> None:
     """Display all upcoming progress by day."""
-    import re
+    from paper_bartender.cli.deps import Container
     from paper_bartender.utils.display import create_day_table, get_paper_color
-    from paper_bartender.services.milestone_service import MilestoneService
 
-    task_service = TaskService()
-    paper_service = PaperService()
-    milestone_service = MilestoneService()
+    container = Container()
+    task_service = container.task_service
+    paper_service = container.paper_service
+    milestone_service = container.milestone_service
 
     # Get paper filter if specified
     paper_id = None
@@ -310,15 +374,22 @@ def show_upcoming(paper_name: Optional[str] = None) -> None:
         print_warning(f'You have {len(overdue)} overdue task(s)!')
         console.print()
 
-    # Get paper names for display
-    paper_names = task_service.get_paper_name_map()
-
     # Show daily progress summary
     tasks = task_service.get_pending(paper_id)
     if not tasks and not overdue:
         print_info('No pending tasks. Great job!')
         return
 
+    # Get paper names for display (skipped entirely on the empty path above)
+    paper_names = task_service.get_paper_name_map()
+
+    # Very large listings skip the Rich tables entirely. Unlike show_today,
+    # overdue is a subset of the pending tasks here, so printing tasks
+    # alone covers everything exactly once.
+    if len(tasks) > _MAX_INTERACTIVE_ROWS:
+        _print_plain(tasks, paper_names)
+        return
+
     # Group tasks by date
     tasks_by_date: Dict[date, List[Task]] = {}
     for task in tasks:
@@ -419,7 +490,7 @@ def show_upcoming(paper_name: Optional[str] = None) -> None:
             milestone_due = get_milestone_due(task)
 
             # Extract percentage and milestone from task description
-            match = re.match(r'\[(\d+)% of \'([^\']+)\'\](.*)', task.description)
+            match = _CHECKPOINT_RE.match(task.description)
             if match:
                 pct = int(match.group(1))
                 milestone = match.group(2)
@@ -473,13 +544,15 @@ def decompose(
     ),
 ) -> None:
     """Decompose milestones into daily tasks using Claude AI."""
-    paper_service = PaperService()
-    paper = paper_service.get_by_name(paper_name)
+    from paper_bartender.cli.deps import Container
+
+    container = Container()
+    paper = container.paper_service.get_by_name(paper_name)
     if paper is None:
         print_error(f'Paper "{paper_name}" not found')
         raise typer.Exit(1)
 
-    decomposition_service = DecompositionService()
+    decomposition_service = container.decomposition_service
 
     try:
         with console.status('Generating tasks with Claude...'):
@@ -501,18 +574,15 @@ def decompose(
     else:
         print_success(f'Generated {len(tasks)} tasks')
 
-    # Group tasks by date for display
-    tasks_by_date: Dict[date, List[Task]] = {}
-    for task in tasks:
-        if task.scheduled_date not in tasks_by_date:
-            tasks_by_date[task.scheduled_date] = []
-        tasks_by_date[task.scheduled_date].append(task)
-
-    for task_date in sorted(tasks_by_date.keys()):
-        console.print(f'\n[bold]{format_date(task_date)}[/bold]')
-        for task in tasks_by_date[task_date]:
+    # Group tasks by date and emit everything in one print
+    by_date = attrgetter('scheduled_date')
+    lines = []
+    for task_date, day_tasks in groupby(sorted(tasks, key=by_date), key=by_date):
+        lines.append(f'\n[bold]{format_date(task_date)}[/bold]')
+        for task in day_tasks:
             hours = f'({task.estimated_hours:.1f}h)' if task.estimated_hours else ''
-            console.print(f'  - {task.description} {hours}')
+            lines.append(f'  - {task.description} {hours}')
+    console.print('\n'.join(lines))
 
 
 @app.command('done')
@@ -526,8 +596,11 @@ def done(
     ),
 ) -> None:
     """Mark a task as completed."""
-    task_service = TaskService()
-    paper_service = PaperService()
+    from paper_bartender.cli.deps import Container
+
+    container = Container()
+    task_service = container.task_service
+    paper_service = container.paper_service
 
     # Get paper filter if specified
     paper_id = None
@@ -573,8 +646,11 @@ def skip(
     ),
 ) -> None:
     """Mark a task as skipped."""
-    task_service = TaskService()
-    paper_service = PaperService()
+    from paper_bartender.cli.deps import Container
+
+    container = Container()
+    task_service = container.task_service
+    paper_service = container.paper_service
 
     # Get paper filter if specified
     paper_id = None
@@ -622,6 +698,8 @@ def clear(
 
     Creates a backup before clearing. Use 'paper-bartender restore' to undo.
     """
+    from paper_bartender.storage.json_store import JsonStore
+
     store = JsonStore()
     data = store.load()
 
@@ -658,6 +736,8 @@ def clear(
 @app.command('restore')
 def restore() -> None:
     """Restore data from the most recent backup."""
+    from paper_bartender.storage.json_store import JsonStore
+
     store = JsonStore()
 
     if store.restore_backup():
@@ -687,10 +767,12 @@ def do_command(
     """
     from pathlib import Path
 
-    from paper_bartender.services.milestone_service import MilestoneService
+    from paper_bartender.cli.deps import Container
     from paper_bartender.services.nlp_parser import NLPParserService
     from paper_bartender.utils.dates import parse_date
 
+    container = Container()
+
     try:
         parser = NLPParserService()
         with console.status('Parsing command...'):
@@ -732,7 +814,7 @@ def do_command(
                 else:
                     print_warning(f'PDF not found or invalid: {pdf_input}')
 
-        paper_service = PaperService()
+        paper_service = container.paper_service
         try:
             deadline_date = parse_date(deadline)
             paper = paper_service.create(
@@ -754,7 +836,7 @@ def do_command(
                     'Describe your milestones (e.g., "finish experiments by 2/4, write results by 2/10, polish paper by 2/15")'
                 )
 
-                milestone_service = MilestoneService()
+                milestone_service = container.milestone_service
 
                 # Try to parse multiple milestones from the input
                 try:
@@ -809,7 +891,7 @@ def do_command(
 
                             # Auto-decompose milestone into tasks
                             try:
-                                decomposition_service = DecompositionService()
+                                decomposition_service = container.decomposition_service
                                 with console.status(f'Generating tasks for "{desc}"...'):
                                     tasks = decomposition_service.decompose_milestone(milestone.id)
                                 print_success(f'Generated {len(tasks)} daily tasks')
@@ -844,7 +926,7 @@ def do_command(
             else:
                 print_warning(f'PDF not found or invalid: {pdf_path}')
 
-        paper_service = PaperService()
+        paper_service = container.paper_service
 
         # Check if paper already exists
         existing_paper = paper_service.get_by_name(name)
@@ -870,7 +952,7 @@ def do_command(
 
         # Now create all milestones
         if milestones_list:
-            milestone_service = MilestoneService()
+            milestone_service = container.milestone_service
             created_milestones = []
             total_tasks = 0
 
@@ -915,7 +997,7 @@ def do_command(
 
                     # Auto-decompose milestone into tasks
                     try:
-                        decomposition_service = DecompositionService()
+                        decomposition_service = container.decomposition_service
                         with console.status(f'Generating tasks for "{description}"...'):
                             tasks = decomposition_service.decompose_milestone(milestone.id)
                         print_success(f'Generated {len(tasks)} daily tasks')
@@ -939,7 +1021,7 @@ def do_command(
             print_error('Could not extract paper name, description, and due date from input')
             raise typer.Exit(1)
 
-        paper_svc = PaperService()
+        paper_svc = container.paper_service
         target_paper = paper_svc.get_by_name(paper_name)
 
         # Paper doesn't exist - offer to create it
@@ -975,7 +1057,7 @@ def do_command(
                 raise typer.Exit(0)
 
         # Now create the milestone
-        milestone_service = MilestoneService()
+        milestone_service = container.milestone_service
         try:
             due = parse_date(due_date)
 
@@ -1003,7 +1085,7 @@ def do_command(
 
             # Auto-decompose milestone into tasks
             try:
-                decomposition_service = DecompositionService()
+                decomposition_service = container.decomposition_service
                 with console.status('Generating daily tasks...'):
                     tasks = decomposition_service.decompose_milestone(milestone.id)
                 print_success(f'Generated {len(tasks)} daily tasks')
@@ -1023,7 +1105,7 @@ def do_command(
             print_error('Could not extract paper name and milestones from input')
             raise typer.Exit(1)
 
-        paper_svc = PaperService()
+        paper_svc = container.paper_service
         target_paper = paper_svc.get_by_name(paper_name)
 
         # Paper doesn't exist - offer to create it
@@ -1059,7 +1141,7 @@ def do_command(
                 raise typer.Exit(0)
 
         # Now create all milestones
-        milestone_service = MilestoneService()
+        milestone_service = container.milestone_service
         created_milestones = []
         total_tasks = 0
 
@@ -1105,7 +1187,7 @@ def do_command(
 
                 # Auto-decompose milestone into tasks
                 try:
-                    decomposition_service = DecompositionService()
+                    decomposition_service = container.decomposition_service
                     with console.status(f'Generating tasks for "{description}"...'):
                         tasks = decomposition_service.decompose_milestone(milestone.id)
                     print_success(f'Generated {len(tasks)} daily tasks')
@@ -1136,7 +1218,7 @@ def do_command(
             print_error('Could not extract paper name from input')
             raise typer.Exit(1)
 
-        paper_svc = PaperService()
+        paper_svc = container.paper_service
         target_paper = paper_svc.get_by_name(name)
 
         if target_paper is None:
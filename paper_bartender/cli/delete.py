@@ -2,8 +2,7 @@
 
 import typer
 
-from paper_bartender.services.milestone_service import MilestoneService
-from paper_bartender.services.paper_service import PaperService
+from paper_bartender.cli.deps import Container
 from paper_bartender.utils.display import print_error, print_success, print_warning
 
 delete_app = typer.Typer(help='Delete papers and milestones')
@@ -20,7 +19,8 @@ def delete_paper(
     ),
 ) -> None:
     """Delete a paper and all its milestones and tasks."""
-    paper_service = PaperService()
+    container = Container()
+    paper_service = container.paper_service
     paper = paper_service.get_by_name(name)
 
     if paper is None:
@@ -29,8 +29,7 @@ def delete_paper(
 
     if not force:
         # Get milestone count for warning
-        milestone_service = MilestoneService()
-        milestones = milestone_service.list_by_paper(paper.id)
+        milestones = container.milestone_service.list_by_paper(paper.id)
 
         warning_msg = f'This will delete paper "{paper.name}"'
         if milestones:
@@ -62,14 +61,14 @@ def delete_milestone(
     ),
 ) -> None:
     """Delete a milestone and all its tasks."""
-    paper_service = PaperService()
-    paper = paper_service.get_by_name(paper_name)
+    container = Container()
+    paper = container.paper_service.get_by_name(paper_name)
 
     if paper is None:
         print_error(f'Paper "{paper_name}" not found')
         raise typer.Exit(1)
 
-    milestone_service = MilestoneService()
+    milestone_service = container.milestone_service
     milestones = milestone_service.list_by_paper(paper.id)
 
     # Find milestone by description (partial match)
@@ -0,0 +1,74 @@
+"""Request-scoped service container for CLI commands."""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from paper_bartender.services.decomposition import DecompositionService
+    from paper_bartender.services.milestone_service import MilestoneService
+    from paper_bartender.services.paper_service import PaperService
+    from paper_bartender.services.task_service import TaskService
+    from paper_bartender.storage.json_store import JsonStore
+
+
+class Container:
+    """Lazily builds services that all share a single JsonStore.
+
+    Each command constructs one container per invocation, so looking up a
+    paper and then creating a milestone (for example) goes through the same
+    store instance instead of each service opening its own. Imports live
+    inside the properties so building a container is free until a service
+    is actually touched.
+    """
+
+    def __init__(self, store: Optional['JsonStore'] = None) -> None:
+        """Initialize the container, optionally around an existing store."""
+        self._store = store
+        self._paper_service: Optional['PaperService'] = None
+        self._milestone_service: Optional['MilestoneService'] = None
+        self._task_service: Optional['TaskService'] = None
+        self._decomposition_service: Optional['DecompositionService'] = None
+
+    @property
+    def store(self) -> 'JsonStore':
+        """The shared JsonStore instance."""
+        if self._store is None:
+            from paper_bartender.storage.json_store import JsonStore
+
+            self._store = JsonStore()
+        return self._store
+
+    @property
+    def paper_service(self) -> 'PaperService':
+        """Paper service backed by the shared store."""
+        if self._paper_service is None:
+            from paper_bartender.services.paper_service import PaperService
+
+            self._paper_service = PaperService(self.store)
+        return self._paper_service
+
+    @property
+    def milestone_service(self) -> 'MilestoneService':
+        """Milestone service backed by the shared store."""
+        if self._milestone_service is None:
+            from paper_bartender.services.milestone_service import MilestoneService
+
+            self._milestone_service = MilestoneService(self.store)
+        return self._milestone_service
+
+    @property
+    def task_service(self) -> 'TaskService':
+        """Task service backed by the shared store."""
+        if self._task_service is None:
+            from paper_bartender.services.task_service import TaskService
+
+            self._task_service = TaskService(self.store)
+        return self._task_service
+
+    @property
+    def decomposition_service(self) -> 'DecompositionService':
+        """Decomposition service backed by the shared store."""
+        if self._decomposition_service is None:
+            from paper_bartender.services.decomposition import DecompositionService
+
+            self._decomposition_service = DecompositionService(self.store)
+        return self._decomposition_service
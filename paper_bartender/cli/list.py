@@ -2,8 +2,7 @@
 
 import typer
 
-from paper_bartender.services.milestone_service import MilestoneService
-from paper_bartender.services.paper_service import PaperService
+from paper_bartender.cli.deps import Container
 from paper_bartender.utils.dates import days_until, format_date
 from paper_bartender.utils.display import (
     console,
@@ -27,8 +26,7 @@ def list_papers(
     ),
 ) -> None:
     """List all papers."""
-    paper_service = PaperService()
-    papers = paper_service.list_all(include_archived=archived)
+    papers = Container().paper_service.list_all(include_archived=archived)
 
     if not papers:
         print_warning('No papers found. Use "paper-bartender add paper" to create one.')
@@ -59,14 +57,13 @@ def list_milestones(
     ),
 ) -> None:
     """List milestones for a paper."""
-    paper_service = PaperService()
-    paper = paper_service.get_by_name(paper_name)
+    container = Container()
+    paper = container.paper_service.get_by_name(paper_name)
     if paper is None:
         print_error(f'Paper "{paper_name}" not found')
         raise typer.Exit(1)
 
-    milestone_service = MilestoneService()
-    milestones = milestone_service.list_by_paper(
+    milestones = container.milestone_service.list_by_paper(
         paper.id,
         include_completed=completed,
     )
@@ -81,12 +78,13 @@ def list_milestones(
     table = create_milestones_table(title=f'Milestones for "{paper.name}"')
     for milestone in milestones:
         status = milestone.status.value
+        style = status_style(status)
         decomposed = '[green]Yes[/green]' if milestone.decomposed else '[yellow]No[/yellow]'
 
         table.add_row(
             milestone.description,
             format_date(milestone.due_date),
-            f'[{status_style(status)}]{status}[/{status_style(status)}]',
+            f'[{style}]{status}[/{style}]',
             str(milestone.priority),
             decomposed,
         )
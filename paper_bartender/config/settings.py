@@ -26,6 +26,9 @@ class Settings(BaseSettings):
     llm_provider: Optional[LLMProvider] = None
     claude_model: str = 'claude-sonnet-4-20250514'
     openai_model: str = 'gpt-4o'
+    # Maximum milestones combined into one decomposition request; larger
+    # papers are split across several requests to keep prompts bounded.
+    max_batch_milestones: int = 8
 
     # Storage Settings
     data_dir: Path = Path.home() / '.paper-bartender'
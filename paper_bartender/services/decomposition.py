@@ -2,9 +2,20 @@
 
 import json
 from datetime import date, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+if TYPE_CHECKING:
+    import anthropic
+    import openai
+
+try:
+    # orjson is a Rust-backed JSON parser, noticeably faster on large responses
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from paper_bartender.config.settings import LLMProvider, Settings, get_settings
 from paper_bartender.models.milestone import Milestone
 from paper_bartender.models.paper import Paper
@@ -14,6 +25,105 @@ from paper_bartender.services.paper_service import PaperService
 from paper_bartender.services.task_service import TaskService
 from paper_bartender.storage.json_store import JsonStore
 
+# Prompt templates hoisted to module scope so the string literals are built
+# once instead of being re-assembled on every call.
+_PROMPT_HEADER = """You are helping a researcher plan tasks for their paper milestone.
+
+PAPER: {paper_name}
+DEADLINE: {deadline}
+"""
+
+_PROMPT_GUIDELINES = """
+Create 2-4 daily tasks that represent PROGRESS CHECKPOINTS toward completing the given milestone.
+
+IMPORTANT GUIDELINES:
+1. Each task MUST include the milestone name in the format: "[X% of '<milestone description>']"
+2. Tasks should be evenly distributed to reach 100% by the due date
+3. After the percentage, provide CONCRETE and SPECIFIC suggestions:
+   - What exactly should be done at this checkpoint
+   - What deliverables or outputs are expected
+   - How to verify this progress has been achieved
+"""
+
+_PROMPT_MILESTONE = """MILESTONE TO COMPLETE:
+- Description: "{description}"
+- Due Date: {due_date}
+
+AVAILABLE DAYS: {days_str}
+TOTAL DAYS AVAILABLE: {num_days}
+"""
+
+_PDF_GUIDELINE = """4. Since a PDF is provided, reference the paper's current state:
+   - Mention specific sections, figures, or tables that need work
+   - Reference actual content from the paper when relevant
+"""
+
+_NO_PDF_GUIDELINE = """4. Give actionable, specific tasks even without PDF context
+"""
+
+_PROMPT_OUTPUT = """
+Return ONLY a JSON array with objects containing:
+- "scheduled_date": date in YYYY-MM-DD format
+- "description": task with format "[X% of '<milestone description>'] Concrete action..."
+- "estimated_hours": estimated hours (2-4)
+
+Example for milestone "rerun experiments":
+[
+  {"scheduled_date": "2025-02-01", "description": "[25% of 'rerun experiments'] Set up experiment environment and verify all dependencies. Checkpoint: environment runs without errors", "estimated_hours": 2},
+  {"scheduled_date": "2025-02-02", "description": "[50% of 'rerun experiments'] Execute baseline experiments and log all outputs. Checkpoint: baseline results match expected ranges", "estimated_hours": 3},
+  {"scheduled_date": "2025-02-03", "description": "[75% of 'rerun experiments'] Run full experiment suite and collect metrics. Checkpoint: all experiments complete with recorded metrics", "estimated_hours": 3},
+  {"scheduled_date": "2025-02-04", "description": "[100% of 'rerun experiments'] Compare results with paper claims and document any discrepancies. Checkpoint: results summary ready for paper update", "estimated_hours": 2}
+]
+
+Return ONLY the JSON array, no other text."""
+
+_BATCH_PROMPT_HEADER = """You are helping a researcher plan tasks for their paper milestones.
+
+PAPER: {paper_name}
+DEADLINE: {deadline}
+"""
+
+_BATCH_MILESTONE_ENTRY = """
+- milestone_id: {milestone_id}
+  Description: "{description}"
+  Due Date: {due_date}
+  Available Days: {days_str}
+"""
+
+_BATCH_GUIDELINES = """
+For EACH milestone, create 2-4 daily tasks that represent PROGRESS CHECKPOINTS
+toward completing it, scheduled only on that milestone's available days.
+
+IMPORTANT GUIDELINES:
+1. Each task MUST include its milestone name in the format: "[X% of '<milestone description>']"
+2. Tasks should be evenly distributed to reach 100% by each milestone's due date
+3. After the percentage, provide CONCRETE and SPECIFIC suggestions:
+   - What exactly should be done at this checkpoint
+   - What deliverables or outputs are expected
+   - How to verify this progress has been achieved
+"""
+
+_BATCH_OUTPUT = """
+Return ONLY a JSON array with one object per milestone:
+[
+  {
+    "milestone_id": "<milestone_id from above>",
+    "tasks": [
+      {"scheduled_date": "YYYY-MM-DD", "description": "[X% of '<milestone description>'] Concrete action...", "estimated_hours": 2}
+    ]
+  }
+]
+
+Return ONLY the JSON array, no other text."""
+
+
+def _format_available_days(available_days: List[date]) -> str:
+    """Format the first 14 available days as an ISO date list."""
+    days_str = ', '.join(d.isoformat() for d in available_days[:14])
+    if len(available_days) > 14:
+        days_str += f' ... ({len(available_days)} days total)'
+    return days_str
+
 
 class DecompositionService:
     """Service for decomposing milestones into daily tasks using LLM."""
@@ -29,15 +139,32 @@ class DecompositionService:
         self._paper_service = PaperService(self._store)
         self._milestone_service = MilestoneService(self._store)
         self._task_service = TaskService(self._store)
+        self._anthropic_client: Optional['anthropic.Anthropic'] = None
+        self._openai_client: Optional['openai.OpenAI'] = None
 
     def _get_available_days(self, start_date: date, end_date: date) -> List[date]:
         """Get list of available days between start and end date."""
-        days = []
-        current = start_date
-        while current <= end_date:
-            days.append(current)
-            current += timedelta(days=1)
-        return days
+        # Ordinal arithmetic avoids allocating a timedelta per day
+        base = start_date.toordinal()
+        n = end_date.toordinal() - base + 1
+        return [date.fromordinal(base + i) for i in range(n)]
+
+    def _milestone_available_days(
+        self,
+        milestone: Milestone,
+        today: Optional[date] = None,
+    ) -> List[date]:
+        """Compute the schedulable days for a milestone."""
+        today = today or date.today()
+        # Use milestone's start_date if set, otherwise use today
+        if milestone.start_date and milestone.start_date >= today:
+            start_date = milestone.start_date
+        elif milestone.start_date and milestone.start_date < today:
+            # If start_date is in the past, use today
+            start_date = today
+        else:
+            start_date = today if today < milestone.due_date else milestone.due_date - timedelta(days=7)
+        return self._get_available_days(start_date, milestone.due_date)
 
     def _create_simple_tasks(
         self,
@@ -114,100 +241,172 @@ Paper excerpt:
         milestone: Milestone,
         available_days: List[date],
         pdf_context: Optional[str] = None,
-    ) -> str:
-        """Build the prompt for the LLM."""
-        days_str = ', '.join(d.strftime('%Y-%m-%d') for d in available_days[:14])
-        if len(available_days) > 14:
-            days_str += f' ... ({len(available_days)} days total)'
+    ) -> Tuple[str, str]:
+        """Build the (system prefix, user suffix) prompt pair for the LLM.
 
-        # Base prompt
-        prompt = f"""You are helping a researcher plan tasks for their paper milestone.
+        The system prefix only depends on the paper, so decomposing several
+        milestones of the same paper reuses an identical prefix — which lets
+        Anthropic's prompt caching skip re-processing it on repeat calls.
+        """
+        return self._render_prompt(
+            paper.name,
+            paper.deadline.isoformat(),
+            milestone.description,
+            milestone.due_date.isoformat(),
+            tuple(available_days),
+            pdf_context,
+        )
 
-PAPER: {paper.name}
-DEADLINE: {paper.deadline.strftime('%Y-%m-%d')}
-"""
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _render_prompt(
+        paper_name: str,
+        deadline_iso: str,
+        description: str,
+        due_iso: str,
+        available_days: Tuple[date, ...],
+        pdf_context: Optional[str],
+    ) -> Tuple[str, str]:
+        """Render the prompt pair; memoized so identical inputs (e.g. a
+        --force rerun over the same milestones) skip re-rendering."""
+        days_str = _format_available_days(list(available_days))
+
+        system_parts = [
+            _PROMPT_HEADER.format(paper_name=paper_name, deadline=deadline_iso)
+        ]
 
         # Add PDF context if available
         if pdf_context:
-            prompt += f"""
-{pdf_context}
-"""
+            system_parts.append(f'\n{pdf_context}\n')
 
-        prompt += f"""
-MILESTONE TO COMPLETE:
-- Description: "{milestone.description}"
-- Due Date: {milestone.due_date.strftime('%Y-%m-%d')}
+        system_parts.append(_PROMPT_GUIDELINES)
+        system_parts.append(_PDF_GUIDELINE if pdf_context else _NO_PDF_GUIDELINE)
+        system_parts.append(_PROMPT_OUTPUT)
 
-AVAILABLE DAYS: {days_str}
-TOTAL DAYS AVAILABLE: {len(available_days)}
+        user = _PROMPT_MILESTONE.format(
+            description=description,
+            due_date=due_iso,
+            days_str=days_str,
+            num_days=len(available_days),
+        )
 
-Create 2-4 daily tasks that represent PROGRESS CHECKPOINTS toward completing the "{milestone.description}" milestone.
+        return ''.join(system_parts), user
 
-IMPORTANT GUIDELINES:
-1. Each task MUST include the milestone name in the format: "[X% of '{milestone.description}']"
-2. Tasks should be evenly distributed to reach 100% by the due date
-3. After the percentage, provide CONCRETE and SPECIFIC suggestions:
-   - What exactly should be done at this checkpoint
-   - What deliverables or outputs are expected
-   - How to verify this progress has been achieved
-"""
+    def _build_batch_prompt(
+        self,
+        paper: Paper,
+        milestones_days: List[Tuple[Milestone, List[date]]],
+        pdf_context: Optional[str] = None,
+    ) -> Tuple[str, str]:
+        """Build the (system prefix, user suffix) pair covering several milestones."""
+        system_parts = [
+            _BATCH_PROMPT_HEADER.format(
+                paper_name=paper.name,
+                deadline=paper.deadline.isoformat(),
+            )
+        ]
 
         if pdf_context:
-            prompt += """4. Since a PDF is provided, reference the paper's current state:
-   - Mention specific sections, figures, or tables that need work
-   - Reference actual content from the paper when relevant
-"""
-        else:
-            prompt += """4. Give actionable, specific tasks even without PDF context
-"""
-
-        prompt += f"""
-Return ONLY a JSON array with objects containing:
-- "scheduled_date": date in YYYY-MM-DD format
-- "description": task with format "[X% of '{milestone.description}'] Concrete action..."
-- "estimated_hours": estimated hours (2-4)
-
-Example for milestone "rerun experiments":
-[
-  {{"scheduled_date": "2025-02-01", "description": "[25% of 'rerun experiments'] Set up experiment environment and verify all dependencies. Checkpoint: environment runs without errors", "estimated_hours": 2}},
-  {{"scheduled_date": "2025-02-02", "description": "[50% of 'rerun experiments'] Execute baseline experiments and log all outputs. Checkpoint: baseline results match expected ranges", "estimated_hours": 3}},
-  {{"scheduled_date": "2025-02-03", "description": "[75% of 'rerun experiments'] Run full experiment suite and collect metrics. Checkpoint: all experiments complete with recorded metrics", "estimated_hours": 3}},
-  {{"scheduled_date": "2025-02-04", "description": "[100% of 'rerun experiments'] Compare results with paper claims and document any discrepancies. Checkpoint: results summary ready for paper update", "estimated_hours": 2}}
-]
-
-Return ONLY the JSON array, no other text."""
+            system_parts.append(f'\n{pdf_context}\n')
+
+        system_parts.append(_BATCH_GUIDELINES)
+        system_parts.append(_PDF_GUIDELINE if pdf_context else _NO_PDF_GUIDELINE)
+        system_parts.append(_BATCH_OUTPUT)
+
+        user_parts = ['MILESTONES TO COMPLETE (in order):\n']
+        for milestone, available_days in milestones_days:
+            user_parts.append(
+                _BATCH_MILESTONE_ENTRY.format(
+                    milestone_id=milestone.id,
+                    description=milestone.description,
+                    due_date=milestone.due_date.isoformat(),
+                    days_str=_format_available_days(available_days),
+                )
+            )
 
-        return prompt
+        return ''.join(system_parts), ''.join(user_parts)
 
-    def _parse_response(
+    def _parse_batch_response(
         self,
         response_text: str,
-        milestone: Milestone,
+        milestones: List[Milestone],
         paper: Paper,
-    ) -> List[Task]:
-        """Parse LLM response into Task objects."""
-        # Extract JSON from response
+    ) -> Dict[UUID, List[Task]]:
+        """Parse a batched LLM response into tasks grouped by milestone."""
+        batch_data = self._extract_json(response_text)
+        if not isinstance(batch_data, list):
+            raise ValueError('Expected a JSON array of milestone entries from the LLM')
+
+        milestones_by_id = {str(m.id): m for m in milestones}
+        tasks_by_milestone: Dict[UUID, List[Task]] = {}
+        for entry in batch_data:
+            if not isinstance(entry, dict):
+                raise ValueError(
+                    f'Expected a JSON object per milestone entry, got: {entry!r}'
+                )
+            milestone = milestones_by_id.get(str(entry.get('milestone_id')))
+            if milestone is None:
+                raise ValueError(
+                    f"Unknown milestone_id in LLM response: {entry.get('milestone_id')}"
+                )
+            entry_tasks = entry.get('tasks', [])
+            if not isinstance(entry_tasks, list):
+                raise ValueError(
+                    f'Expected a JSON array of tasks per milestone, got: {entry_tasks!r}'
+                )
+            tasks_by_milestone[milestone.id] = self._tasks_from_items(
+                entry_tasks, milestone, paper
+            )
+
+        missing = [m for m in milestones if m.id not in tasks_by_milestone]
+        if missing:
+            raise ValueError(
+                'LLM response missing tasks for milestones: '
+                + ', '.join(str(m.id) for m in missing)
+            )
+
+        return tasks_by_milestone
+
+    def _extract_json(self, response_text: str) -> object:
+        """Extract and parse the JSON payload from an LLM response."""
         text = response_text.strip()
         if text.startswith('```'):
-            # Remove markdown code blocks
-            lines = text.split('\n')
-            text = '\n'.join(
-                line for line in lines
-                if not line.startswith('```')
-            )
+            # Drop the opening fence line and, if present, the closing fence —
+            # two slices instead of splitting and rejoining every line
+            text = text[text.find('\n') + 1:]
+            if text.endswith('```'):
+                text = text[:text.rfind('```')].rstrip()
 
         try:
-            task_data = json.loads(text)
-        except json.JSONDecodeError as e:
+            return _json_loads(text)
+        except ValueError as e:
             raise ValueError(f'Failed to parse LLM response as JSON: {e}') from e
 
+    def _tasks_from_items(
+        self,
+        items: List[Dict[str, Any]],
+        milestone: Milestone,
+        paper: Paper,
+    ) -> List[Task]:
+        """Build Task objects from parsed response items.
+
+        Raises:
+            ValueError: If an item is not an object or is missing/mistyping
+                a required field, so callers can fall back cleanly.
+        """
         tasks = []
-        for item in task_data:
-            scheduled_date = date.fromisoformat(item['scheduled_date'])
+        for item in items:
+            if not isinstance(item, dict):
+                raise ValueError(f'Expected a JSON object per task, got: {item!r}')
+            try:
+                scheduled_date = date.fromisoformat(item['scheduled_date'])
+                description = item['description']
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f'Malformed task item in LLM response: {item!r}') from e
             task = Task(
                 milestone_id=milestone.id,
                 paper_id=paper.id,
-                description=item['description'],
+                description=description,
                 scheduled_date=scheduled_date,
                 estimated_hours=item.get('estimated_hours', self._settings.default_task_hours),
             )
@@ -215,16 +414,59 @@ Return ONLY the JSON array, no other text."""
 
         return tasks
 
-    def _call_anthropic(self, prompt: str) -> str:
-        """Call Anthropic Claude API."""
-        import anthropic
+    def _parse_response(
+        self,
+        response_text: str,
+        milestone: Milestone,
+        paper: Paper,
+    ) -> List[Task]:
+        """Parse LLM response into Task objects."""
+        task_data = self._extract_json(response_text)
+        if not isinstance(task_data, list):
+            raise ValueError('Expected a JSON array of tasks from the LLM')
+        return self._tasks_from_items(task_data, milestone, paper)
+
+    def _get_anthropic_client(self) -> 'anthropic.Anthropic':
+        """Get the Anthropic client, constructing it once per service instance."""
+        if self._anthropic_client is None:
+            import anthropic
+
+            self._anthropic_client = anthropic.Anthropic(
+                api_key=self._settings.anthropic_api_key
+            )
+        return self._anthropic_client
+
+    def _get_openai_client(self) -> 'openai.OpenAI':
+        """Get the OpenAI client, constructing it once per service instance."""
+        if self._openai_client is None:
+            import openai
+
+            self._openai_client = openai.OpenAI(
+                api_key=self._settings.openai_api_key
+            )
+        return self._openai_client
+
+    def _call_anthropic(self, system: str, user: str) -> str:
+        """Call Anthropic Claude API.
 
-        client = anthropic.Anthropic(api_key=self._settings.anthropic_api_key)
+        The system prefix is marked with an ephemeral cache_control block so
+        sequential calls sharing the same paper context (decompose_paper over
+        several milestones) hit Anthropic's server-side prompt cache instead
+        of re-processing the prefix tokens.
+        """
+        client = self._get_anthropic_client()
         message = client.messages.create(
             model=self._settings.claude_model,
             max_tokens=4096,
+            system=[
+                {
+                    'type': 'text',
+                    'text': system,
+                    'cache_control': {'type': 'ephemeral'},
+                }
+            ],
             messages=[
-                {'role': 'user', 'content': prompt}
+                {'role': 'user', 'content': user}
             ],
         )
 
@@ -233,16 +475,15 @@ Return ONLY the JSON array, no other text."""
             raise ValueError('Unexpected response type from Anthropic API')
         return str(content_block.text)
 
-    def _call_openai(self, prompt: str) -> str:
+    def _call_openai(self, system: str, user: str) -> str:
         """Call OpenAI API."""
-        import openai
-
-        client = openai.OpenAI(api_key=self._settings.openai_api_key)
+        client = self._get_openai_client()
         response = client.chat.completions.create(
             model=self._settings.openai_model,
             max_tokens=4096,
             messages=[
-                {'role': 'user', 'content': prompt}
+                {'role': 'system', 'content': system},
+                {'role': 'user', 'content': user},
             ],
         )
 
@@ -251,14 +492,14 @@ Return ONLY the JSON array, no other text."""
             raise ValueError('Empty response from OpenAI API')
         return content
 
-    def _call_llm(self, prompt: str) -> str:
+    def _call_llm(self, system: str, user: str) -> str:
         """Call the configured LLM provider."""
         provider = self._settings.get_provider()
 
         if provider == LLMProvider.ANTHROPIC:
-            return self._call_anthropic(prompt)
+            return self._call_anthropic(system, user)
         elif provider == LLMProvider.OPENAI:
-            return self._call_openai(prompt)
+            return self._call_openai(system, user)
         else:
             raise ValueError(f'Unknown LLM provider: {provider}')
 
@@ -267,6 +508,7 @@ Return ONLY the JSON array, no other text."""
         milestone_id: UUID,
         force: bool = False,
         dry_run: bool = False,
+        today: Optional[date] = None,
     ) -> List[Task]:
         """Decompose a milestone into daily tasks.
 
@@ -274,6 +516,9 @@ Return ONLY the JSON array, no other text."""
             milestone_id: ID of the milestone to decompose.
             force: If True, re-decompose even if already decomposed.
             dry_run: If True, return tasks without saving.
+            today: Reference date for scheduling; defaults to the current
+                date. Callers looping over milestones pass it once so every
+                milestone shares the same clock reading.
 
         Returns:
             List of generated tasks.
@@ -296,16 +541,7 @@ Return ONLY the JSON array, no other text."""
             raise ValueError('Paper for milestone not found')
 
         # Calculate available days
-        today = date.today()
-        # Use milestone's start_date if set, otherwise use today
-        if milestone.start_date and milestone.start_date >= today:
-            start_date = milestone.start_date
-        elif milestone.start_date and milestone.start_date < today:
-            # If start_date is in the past, use today
-            start_date = today
-        else:
-            start_date = today if today < milestone.due_date else milestone.due_date - timedelta(days=7)
-        available_days = self._get_available_days(start_date, milestone.due_date)
+        available_days = self._milestone_available_days(milestone, today)
 
         if not available_days:
             raise ValueError('No available days for scheduling tasks')
@@ -317,8 +553,8 @@ Return ONLY the JSON array, no other text."""
 
         if pdf_context:
             # Full LLM-based decomposition with PDF context
-            prompt = self._build_prompt(paper, milestone, available_days, pdf_context)
-            response_text = self._call_llm(prompt)
+            system, user = self._build_prompt(paper, milestone, available_days, pdf_context)
+            response_text = self._call_llm(system, user)
             tasks = self._parse_response(response_text, milestone, paper)
         else:
             # Simple percentage-based decomposition without PDF
@@ -345,6 +581,11 @@ Return ONLY the JSON array, no other text."""
     ) -> List[Task]:
         """Decompose all pending milestones for a paper.
 
+        Milestones that need the LLM are combined into batched requests (one
+        request per ``max_batch_milestones`` milestones) instead of one
+        round-trip per milestone. On a malformed batch response this falls
+        back to per-milestone decomposition.
+
         Args:
             paper_id: ID of the paper.
             force: If True, re-decompose even if already decomposed.
@@ -365,9 +606,81 @@ Return ONLY the JSON array, no other text."""
         if not milestones:
             return []
 
-        all_tasks: List[Task] = []
-        for milestone in milestones:
-            tasks = self.decompose_milestone(milestone.id, force=force, dry_run=dry_run)
-            all_tasks.extend(tasks)
+        pdf_context = None
+        if paper.pdf_path:
+            pdf_context = self._get_pdf_context(paper)
+
+        # One clock reading shared by every milestone in this run
+        today = date.today()
+
+        if pdf_context is None:
+            # Simple percentage-based decomposition needs no LLM round-trips,
+            # so there is nothing to batch.
+            all_tasks: List[Task] = []
+            for milestone in milestones:
+                tasks = self.decompose_milestone(
+                    milestone.id, force=force, dry_run=dry_run, today=today
+                )
+                all_tasks.extend(tasks)
+            return all_tasks
+
+        all_tasks = []
+        batch_size = self._settings.max_batch_milestones
+        for start in range(0, len(milestones), batch_size):
+            chunk = milestones[start:start + batch_size]
+            all_tasks.extend(
+                self._decompose_chunk(paper, chunk, pdf_context, today, force, dry_run)
+            )
 
         return all_tasks
+
+    def _decompose_chunk(
+        self,
+        paper: Paper,
+        chunk: List[Milestone],
+        pdf_context: str,
+        today: date,
+        force: bool,
+        dry_run: bool,
+    ) -> List[Task]:
+        """Decompose one batch of milestones with a single LLM round-trip.
+
+        Falls back to one request per milestone when the batched response
+        cannot be parsed or does not cover the whole chunk.
+        """
+        try:
+            milestones_days = [
+                (m, self._milestone_available_days(m, today)) for m in chunk
+            ]
+            system, user = self._build_batch_prompt(paper, milestones_days, pdf_context)
+            response_text = self._call_llm(system, user)
+            tasks_by_milestone = self._parse_batch_response(response_text, chunk, paper)
+        except ValueError:
+            # Fall back to one request per milestone
+            fallback_tasks: List[Task] = []
+            for milestone in chunk:
+                fallback_tasks.extend(
+                    self.decompose_milestone(
+                        milestone.id, force=force, dry_run=dry_run, today=today
+                    )
+                )
+            return fallback_tasks
+
+        chunk_tasks = [
+            task for m in chunk for task in tasks_by_milestone.get(m.id, [])
+        ]
+
+        if not dry_run:
+            # Delete existing tasks if force re-decomposing
+            if force:
+                decomposed_ids = [m.id for m in chunk if m.decomposed]
+                if decomposed_ids:
+                    self._task_service.delete_by_milestones(decomposed_ids)
+
+            # Save new tasks in one bulk write
+            self._task_service.create_bulk(chunk_tasks)
+
+            # Mark milestones as decomposed with one store write
+            self._milestone_service.mark_decomposed_many([m.id for m in chunk])
+
+        return chunk_tasks
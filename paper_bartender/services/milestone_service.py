@@ -94,6 +94,24 @@ class MilestoneService:
                 return milestone
         raise ValueError(f'Milestone with id {milestone.id} not found')
 
+    def mark_decomposed_many(self, milestone_ids: List[UUID]) -> List[Milestone]:
+        """Mark several milestones as decomposed with a single store write.
+
+        Membership is validated before anything is mutated: inside a
+        batch() block load() hands out the shared pending document, so
+        mutations made before raising would otherwise get flushed.
+        """
+        data = self._store.load()
+        wanted = set(milestone_ids)
+        found = [m for m in data.milestones if m.id in wanted]
+        if len(found) != len(wanted):
+            missing = wanted - {m.id for m in found}
+            raise ValueError(f'Milestone(s) not found: {", ".join(str(m) for m in missing)}')
+        for milestone in found:
+            milestone.decomposed = True
+        self._store.save(data)
+        return found
+
     def mark_decomposed(self, milestone_id: UUID) -> Milestone:
         """Mark a milestone as decomposed."""
         milestone = self.get_by_id(milestone_id)
@@ -1,7 +1,7 @@
 """Paper service for CRUD operations."""
 
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from paper_bartender.models.paper import Paper
@@ -15,6 +15,44 @@ class PaperService:
     def __init__(self, store: Optional[JsonStore] = None) -> None:
         """Initialize the paper service."""
         self._store = store or JsonStore()
+        self._by_lower: Optional[Dict[str, Paper]] = None
+        self._by_deadline: Optional[List[Paper]] = None
+        self._index_version = -1
+
+    def _sync_indexes(self) -> None:
+        """Drop cached indexes if the store has been written to since they
+        were built — including writes made through other services sharing
+        the same store (e.g. a milestone delete removing tasks)."""
+        if self._index_version != self._store.version:
+            self._by_lower = None
+            self._by_deadline = None
+            self._index_version = self._store.version
+
+    def _name_index(self, data: StorageData) -> Dict[str, Paper]:
+        """Lazily build the lowercase-name lookup index.
+
+        setdefault keeps the first paper per name, matching the original
+        first-match scan semantics. The index is rebuilt whenever the
+        store's version counter moves.
+        """
+        self._sync_indexes()
+        if self._by_lower is None:
+            index: Dict[str, Paper] = {}
+            for paper in data.papers:
+                index.setdefault(paper.name.lower(), paper)
+            self._by_lower = index
+        return self._by_lower
+
+    def _deadline_index(self, data: StorageData) -> List[Paper]:
+        """Lazily build the deadline-sorted paper list.
+
+        Repeated list_all calls then skip the O(N log N) sort; like the
+        name index, the cache follows the store's version counter.
+        """
+        self._sync_indexes()
+        if self._by_deadline is None:
+            self._by_deadline = sorted(data.papers, key=lambda p: p.deadline)
+        return self._by_deadline
 
     def create(
         self,
@@ -27,8 +65,9 @@ class PaperService:
         data = self._store.load()
 
         # Check for duplicate name
+        lowered = name.lower()
         for paper in data.papers:
-            if paper.name.lower() == name.lower() and not paper.archived:
+            if paper.name.lower() == lowered and not paper.archived:
                 raise ValueError(f"Paper with name '{name}' already exists")
 
         paper = Paper(
@@ -51,19 +90,14 @@ class PaperService:
 
     def get_by_name(self, name: str) -> Optional[Paper]:
         """Get a paper by name (case-insensitive)."""
-        data = self._store.load()
-        for paper in data.papers:
-            if paper.name.lower() == name.lower():
-                return paper
-        return None
+        return self._name_index(self._store.load()).get(name.lower())
 
     def list_all(self, include_archived: bool = False) -> List[Paper]:
-        """List all papers."""
-        data = self._store.load()
-        papers = data.papers
+        """List all papers, sorted by deadline."""
+        papers = self._deadline_index(self._store.load())
         if not include_archived:
-            papers = [p for p in papers if not p.archived]
-        return sorted(papers, key=lambda p: p.deadline)
+            return [p for p in papers if not p.archived]
+        return list(papers)
 
     def update(self, paper: Paper) -> Paper:
         """Update an existing paper."""
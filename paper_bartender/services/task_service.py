@@ -1,9 +1,11 @@
 """Task service for CRUD operations."""
 
+from collections import defaultdict
 from datetime import date
 from typing import Dict, List, Optional
 from uuid import UUID
 
+from paper_bartender.models.storage import StorageData
 from paper_bartender.models.task import Task, TaskStatus
 from paper_bartender.storage.json_store import JsonStore
 
@@ -14,6 +16,27 @@ class TaskService:
     def __init__(self, store: Optional[JsonStore] = None) -> None:
         """Initialize the task service."""
         self._store = store or JsonStore()
+        self._by_date: Optional[Dict[date, List[Task]]] = None
+        self._index_version = -1
+
+    def _date_index(self, data: StorageData) -> Dict[date, List[Task]]:
+        """Lazily bucket tasks by scheduled date.
+
+        Date-window queries (today, overdue) then touch only the buckets
+        they need instead of scanning every task. The index is rebuilt
+        whenever the store's version counter moves, so writes made through
+        other services sharing the store (e.g. a milestone delete removing
+        tasks) are picked up too.
+        """
+        if self._index_version != self._store.version:
+            self._by_date = None
+            self._index_version = self._store.version
+        if self._by_date is None:
+            index: Dict[date, List[Task]] = defaultdict(list)
+            for task in data.tasks:
+                index[task.scheduled_date].append(task)
+            self._by_date = dict(index)
+        return self._by_date
 
     def create(
         self,
@@ -58,8 +81,7 @@ class TaskService:
         paper_id: Optional[UUID] = None,
     ) -> List[Task]:
         """Get tasks scheduled for a specific date."""
-        data = self._store.load()
-        tasks = [t for t in data.tasks if t.scheduled_date == target_date]
+        tasks = list(self._date_index(self._store.load()).get(target_date, []))
         if paper_id:
             tasks = [t for t in tasks if t.paper_id == paper_id]
         return tasks
@@ -99,14 +121,16 @@ class TaskService:
     def get_overdue(self, paper_id: Optional[UUID] = None) -> List[Task]:
         """Get overdue tasks (pending tasks with past scheduled date)."""
         today = date.today()
-        data = self._store.load()
+        index = self._date_index(self._store.load())
         tasks = [
-            t for t in data.tasks
-            if t.scheduled_date < today and t.status == TaskStatus.PENDING
+            t
+            for d in sorted(d for d in index if d < today)
+            for t in index[d]
+            if t.status == TaskStatus.PENDING
         ]
         if paper_id:
             tasks = [t for t in tasks if t.paper_id == paper_id]
-        return sorted(tasks, key=lambda t: t.scheduled_date)
+        return tasks
 
     def update(self, task: Task) -> Task:
         """Update an existing task."""
@@ -136,9 +160,14 @@ class TaskService:
 
     def delete_by_milestone(self, milestone_id: UUID) -> int:
         """Delete all tasks for a milestone."""
+        return self.delete_by_milestones([milestone_id])
+
+    def delete_by_milestones(self, milestone_ids: List[UUID]) -> int:
+        """Delete all tasks for several milestones with a single store write."""
         data = self._store.load()
+        wanted = set(milestone_ids)
         original_count = len(data.tasks)
-        data.tasks = [t for t in data.tasks if t.milestone_id != milestone_id]
+        data.tasks = [t for t in data.tasks if t.milestone_id not in wanted]
         deleted = original_count - len(data.tasks)
         if deleted > 0:
             self._store.save(data)
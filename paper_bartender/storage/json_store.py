@@ -2,72 +2,196 @@
 
 import json
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Protocol
 
 from paper_bartender.config.settings import Settings, get_settings
 from paper_bartender.models.storage import StorageData
 
 
-class JsonStore:
-    """Handles JSON file storage with atomic writes and backups."""
+class StorageBackend(Protocol):
+    """Where the serialized JSON document is kept."""
+
+    def read(self) -> Optional[str]:
+        """Read the stored document, or None if nothing has been saved."""
+        ...
+
+    def write(self, text: str) -> None:
+        """Store the document."""
+        ...
+
+    def backup(self) -> Optional[Path]:
+        """Snapshot the document; returns the backup file path, if any."""
+        ...
+
+    def restore_backup(self) -> bool:
+        """Restore the snapshot if one exists."""
+        ...
+
 
-    def __init__(self, settings: Optional[Settings] = None) -> None:
-        """Initialize the JSON store."""
-        self._settings = settings or get_settings()
-        self._ensure_data_dir()
+class FileBackend:
+    """Stores the JSON document on disk with atomic writes and backups."""
 
-    def _ensure_data_dir(self) -> None:
-        """Ensure the data directory exists."""
+    def __init__(self, settings: Settings) -> None:
+        """Initialize the backend and ensure the data directory exists."""
+        self._settings = settings
         self._settings.data_dir.mkdir(parents=True, exist_ok=True)
 
-    def load(self) -> StorageData:
-        """Load data from the JSON file."""
-        data_path = self._settings.data_path
-        if not data_path.exists():
-            return StorageData()
+    @property
+    def _data_path(self) -> Path:
+        return self._settings.data_path
 
-        with open(data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return StorageData.model_validate(data)
+    @property
+    def _backup_path(self) -> Path:
+        return self._data_path.with_suffix('.backup.json')
 
-    def save(self, data: StorageData) -> None:
-        """Save data to the JSON file with atomic write."""
-        data_path = self._settings.data_path
-        tmp_path = data_path.with_suffix('.tmp')
+    def read(self) -> Optional[str]:
+        """Read the stored document, or None if nothing has been saved."""
+        if not self._data_path.exists():
+            return None
+        return self._data_path.read_text(encoding='utf-8')
 
-        json_str = data.model_dump_json(indent=2)
+    def write(self, text: str) -> None:
+        """Write the document atomically via a temp file."""
+        tmp_path = self._data_path.with_suffix('.tmp')
         with open(tmp_path, 'w', encoding='utf-8') as f:
-            f.write(json_str)
-
-        tmp_path.replace(data_path)
+            f.write(text)
+        tmp_path.replace(self._data_path)
 
     def backup(self) -> Optional[Path]:
         """Create a backup of the data file."""
-        data_path = self._settings.data_path
-        if not data_path.exists():
+        if not self._data_path.exists():
             return None
-
-        backup_path = data_path.with_suffix('.backup.json')
-        shutil.copy2(data_path, backup_path)
-        return Path(backup_path)
+        shutil.copy2(self._data_path, self._backup_path)
+        return self._backup_path
 
     def restore_backup(self) -> bool:
         """Restore from backup if it exists."""
-        data_path = self._settings.data_path
-        backup_path = data_path.with_suffix('.backup.json')
-
-        if not backup_path.exists():
+        if not self._backup_path.exists():
             return False
+        shutil.copy2(self._backup_path, self._data_path)
+        return True
+
+
+class InMemoryBackend:
+    """Keeps the JSON document in memory; used by tests to skip disk I/O."""
+
+    def __init__(self) -> None:
+        """Initialize an empty backend."""
+        self._text: Optional[str] = None
+        self._backup: Optional[str] = None
+
+    def read(self) -> Optional[str]:
+        """Read the stored document, or None if nothing has been saved."""
+        return self._text
+
+    def write(self, text: str) -> None:
+        """Store the document."""
+        self._text = text
+
+    def backup(self) -> Optional[Path]:
+        """Snapshot the document in memory; there is no backup file path."""
+        if self._text is not None:
+            self._backup = self._text
+        return None
 
-        shutil.copy2(backup_path, data_path)
+    def restore_backup(self) -> bool:
+        """Restore the snapshot if one exists."""
+        if self._backup is None:
+            return False
+        self._text = self._backup
         return True
 
+
+class JsonStore:
+    """Handles JSON storage through a pluggable backend."""
+
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        backend: Optional[StorageBackend] = None,
+    ) -> None:
+        """Initialize the JSON store.
+
+        By default data lives in a file under the configured data
+        directory; passing a backend (e.g. InMemoryBackend) overrides
+        where the document is kept.
+        """
+        if backend is None:
+            backend = FileBackend(settings or get_settings())
+        self._backend = backend
+        self._batching = False
+        self._pending: Optional[StorageData] = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Monotonic write counter, bumped on every mutation.
+
+        Services cache derived indexes against this value so a write made
+        through any service sharing the store invalidates them all.
+        """
+        return self._version
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer disk writes so a block of mutations flushes once.
+
+        While the block runs, save() stashes the latest data in memory and
+        load() reads it back, so services behave exactly as usual; the
+        final state is written to disk when the block exits.
+        """
+        if self._batching:
+            # Nested batch: let the outermost one flush
+            yield
+            return
+
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._pending is not None:
+                data, self._pending = self._pending, None
+                self.save(data)
+
+    def load(self) -> StorageData:
+        """Load data from the store."""
+        if self._pending is not None:
+            return self._pending
+
+        text = self._backend.read()
+        if text is None:
+            return StorageData()
+        return StorageData.model_validate(json.loads(text))
+
+    def save(self, data: StorageData) -> None:
+        """Save data to the store."""
+        self._version += 1
+        if self._batching:
+            self._pending = data
+            return
+
+        self._backend.write(data.model_dump_json(indent=2))
+
+    def backup(self) -> Optional[Path]:
+        """Create a backup of the stored data."""
+        return self._backend.backup()
+
+    def restore_backup(self) -> bool:
+        """Restore from backup if it exists."""
+        restored = self._backend.restore_backup()
+        if restored:
+            self._version += 1
+        return restored
+
     def clear(self) -> Optional[Path]:
         """Clear all data, creating a backup first.
 
         Returns:
-            Path to the backup file, or None if no data existed.
+            Path to the backup file, or None if no data existed or the
+            backend keeps its backup in memory.
         """
         backup_path = self.backup()
         self.save(StorageData())
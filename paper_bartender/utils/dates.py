@@ -4,7 +4,39 @@ import re
 from datetime import date, timedelta
 from typing import Optional
 
-from dateutil import parser as date_parser
+
+def _parse_relative(date_str: str, today: date) -> Optional[date]:
+    """Parse the relative forms of parse_date, or None if none match.
+
+    Covers "today"/"tomorrow", "in X days/weeks" and the short "5/10"
+    month/day format.
+    """
+    if date_str == 'today':
+        return today
+
+    if date_str == 'tomorrow':
+        return today + timedelta(days=1)
+
+    # Handle "in X days/weeks" format
+    match = re.match(r'^in\s+(\d+)\s+(day|days|week|weeks)$', date_str)
+    if match:
+        amount = int(match.group(1))
+        if match.group(2).startswith('week'):
+            return today + timedelta(weeks=amount)
+        return today + timedelta(days=amount)
+
+    # Handle short date format like "5/10" (assume current year)
+    match = re.match(r'^(\d{1,2})/(\d{1,2})$', date_str)
+    if match:
+        month = int(match.group(1))
+        day = int(match.group(2))
+        result = date(today.year, month, day)
+        # If date has passed, assume next year
+        if result < today:
+            result = date(today.year + 1, month, day)
+        return result
+
+    return None
 
 
 def parse_date(date_str: str) -> date:
@@ -26,39 +58,24 @@ def parse_date(date_str: str) -> date:
         ValueError: If the date string cannot be parsed.
     """
     date_str = date_str.strip().lower()
-    today = date.today()
-
-    # Handle relative dates
-    if date_str == 'today':
-        return today
 
-    if date_str == 'tomorrow':
-        return today + timedelta(days=1)
+    # Fast path: ISO dates are common and need no flexible parsing,
+    # so dateutil is only imported when we actually fall through to it
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        pass
 
-    # Handle "in X days/weeks" format
-    in_pattern = r'^in\s+(\d+)\s+(day|days|week|weeks)$'
-    match = re.match(in_pattern, date_str)
-    if match:
-        amount = int(match.group(1))
-        unit = match.group(2)
-        if unit.startswith('week'):
-            return today + timedelta(weeks=amount)
-        return today + timedelta(days=amount)
+    today = date.today()
 
-    # Handle short date format like "5/10" (assume current year)
-    short_date_pattern = r'^(\d{1,2})/(\d{1,2})$'
-    match = re.match(short_date_pattern, date_str)
-    if match:
-        month = int(match.group(1))
-        day = int(match.group(2))
-        year = today.year
-        result = date(year, month, day)
-        # If date has passed, assume next year
-        if result < today:
-            result = date(year + 1, month, day)
-        return result
+    # Handle relative and short formats
+    relative = _parse_relative(date_str, today)
+    if relative is not None:
+        return relative
 
     # Use dateutil for other formats
+    from dateutil import parser as date_parser
+
     try:
         parsed = date_parser.parse(date_str, fuzzy=True)
         result = parsed.date()
@@ -1,6 +1,7 @@
 """Display utilities using Rich."""
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 
 from rich.console import Console
 from rich.panel import Panel
@@ -30,46 +31,68 @@ def print_info(message: str) -> None:
     console.print(f'[blue]ℹ[/blue] {message}')
 
 
+# Column definitions shared by the table factories below, hoisted to module
+# scope so each render reuses the same tuples instead of rebuilding kwargs.
+_ColumnDefs = Tuple[Tuple[str, Dict[str, Any]], ...]
+
+_PAPER_COLS: _ColumnDefs = (
+    ('Name', {'style': 'cyan'}),
+    ('Deadline', {'style': 'yellow'}),
+    ('Days Left', {'justify': 'right'}),
+)
+
+_MILESTONE_COLS: _ColumnDefs = (
+    ('Description', {'style': 'cyan'}),
+    ('Due Date', {'style': 'yellow'}),
+    ('Status', {'style': 'green'}),
+    ('Priority', {'justify': 'right'}),
+    ('Decomposed', {'justify': 'center'}),
+)
+
+_TASK_COLS: _ColumnDefs = (
+    ('Paper', {'style': 'bold', 'width': 16, 'no_wrap': True}),
+    ('Final Deadline', {'no_wrap': True}),
+    ('Milestone Due', {'no_wrap': True}),
+    ('Checkpoint', {}),
+    ('Detailed Task', {}),
+)
+
+
+def _build_table(title: str, columns: _ColumnDefs, **table_kwargs: Any) -> Table:
+    """Create a table with the given column definitions."""
+    table = Table(title=title, show_header=True, header_style='bold', **table_kwargs)
+    for name, kwargs in columns:
+        table.add_column(name, **kwargs)
+    return table
+
+
 def create_papers_table(title: str = 'Papers') -> Table:
     """Create a table for displaying papers."""
-    table = Table(title=title, show_header=True, header_style='bold')
-    table.add_column('Name', style='cyan')
-    table.add_column('Deadline', style='yellow')
-    table.add_column('Days Left', justify='right')
-    return table
+    return _build_table(title, _PAPER_COLS)
 
 
 def create_milestones_table(title: str = 'Milestones') -> Table:
     """Create a table for displaying milestones."""
-    table = Table(title=title, show_header=True, header_style='bold')
-    table.add_column('Description', style='cyan')
-    table.add_column('Due Date', style='yellow')
-    table.add_column('Status', style='green')
-    table.add_column('Priority', justify='right')
-    table.add_column('Decomposed', justify='center')
-    return table
+    return _build_table(title, _MILESTONE_COLS)
 
 
 def create_tasks_table(title: str = 'Tasks') -> Table:
     """Create a table for displaying tasks."""
-    table = Table(title=title, show_header=True, header_style='bold')
-    table.add_column('Paper', style='bold', width=16, no_wrap=True)
-    table.add_column('Final Deadline', no_wrap=True)
-    table.add_column('Milestone Due', no_wrap=True)
-    table.add_column('Checkpoint')
-    table.add_column('Detailed Task')
-    return table
+    return _build_table(title, _TASK_COLS)
+
+
+# Frozen so callers can't mutate the shared mapping; built once at import
+_STATUS_STYLES = MappingProxyType({
+    'pending': 'yellow',
+    'in_progress': 'blue',
+    'completed': 'green',
+    'skipped': 'dim',
+})
 
 
 def status_style(status: str) -> str:
     """Get the style for a status value."""
-    styles = {
-        'pending': 'yellow',
-        'in_progress': 'blue',
-        'completed': 'green',
-        'skipped': 'dim',
-    }
-    return styles.get(status, 'white')
+    return _STATUS_STYLES.get(status, 'white')
 
 
 # Color palette for papers (cycles through these)
@@ -94,15 +117,5 @@ def create_progress_bar(percentage: int, width: int = 20) -> str:
 
 def create_day_table(date_str: str, task_count: int) -> Table:
     """Create a table for a single day's tasks."""
-    table = Table(
-        title=f'[bold]{date_str}[/bold] [dim]({task_count} task{"s" if task_count != 1 else ""})[/dim]',
-        title_justify='left',
-        show_header=True,
-        header_style='bold',
-    )
-    table.add_column('Paper', style='bold', width=16, no_wrap=True)
-    table.add_column('Final Deadline', no_wrap=True)
-    table.add_column('Milestone Due', no_wrap=True)
-    table.add_column('Checkpoint')
-    table.add_column('Detailed Task')
-    return table
+    title = f'[bold]{date_str}[/bold] [dim]({task_count} task{"s" if task_count != 1 else ""})[/dim]'
+    return _build_table(title, _TASK_COLS, title_justify='left')
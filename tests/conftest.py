@@ -3,26 +3,67 @@
 import tempfile
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator, Tuple
 from uuid import uuid4
 
 import pytest
+from freezegun import freeze_time
 
 from paper_bartender.config.settings import Settings
 from paper_bartender.models.milestone import Milestone, MilestoneStatus
 from paper_bartender.models.paper import Paper
+from paper_bartender.models.storage import StorageData
 from paper_bartender.models.task import Task, TaskStatus
-from paper_bartender.storage.json_store import JsonStore
+from paper_bartender.services.milestone_service import MilestoneService
+from paper_bartender.services.paper_service import PaperService
+from paper_bartender.services.task_service import TaskService
+from paper_bartender.storage.json_store import InMemoryBackend, JsonStore
 
+# Frozen so every date.today() in the suite — inside the code under test
+# and inside assertions — observes the same cheap, deterministic value.
+# 5/10 matches the short-format parse test, which expects month 5, day 10.
+_FROZEN_DATE = '2025-05-10'
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True, scope='session')
+def _freeze() -> Generator[None, None, None]:
+    """Freeze the clock for the whole session."""
+    with freeze_time(_FROZEN_DATE):
+        yield
+
+
+@pytest.fixture(scope='session')
+def today(_freeze: None) -> date:
+    """Today's (frozen) date, computed once per session.
+
+    Sharing one date object keeps input and expectation on the same clock
+    and avoids a syscall per assertion.
+    """
+    return date.today()
+
+
+@pytest.fixture(scope='module')
 def temp_data_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test data."""
+    """Create a temporary directory for test data, shared per module."""
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_store(test_store: JsonStore, temp_data_dir: Path) -> None:
+    """Start each test from an empty store.
+
+    The data directory and store are module-scoped to avoid per-test
+    churn, so isolation comes from emptying the in-memory store and
+    wiping the directory's contents (data file, backups, tmp files)
+    before each test instead.
+    """
+    test_store.save(StorageData())
+    for leftover in temp_data_dir.iterdir():
+        leftover.unlink()
+
+
+@pytest.fixture(scope='module')
 def test_settings(temp_data_dir: Path) -> Settings:
     """Create test settings with temporary data directory."""
     return Settings(
@@ -31,43 +72,97 @@ def test_settings(temp_data_dir: Path) -> Settings:
     )
 
 
+@pytest.fixture(scope='module')
+def test_store() -> JsonStore:
+    """Create a JsonStore that keeps its data in memory.
+
+    Service tests exercise the store's logic, not the filesystem, so
+    they skip disk entirely; use test_store_disk to cover persistence.
+    """
+    return JsonStore(backend=InMemoryBackend())
+
+
 @pytest.fixture
-def test_store(test_settings: Settings) -> JsonStore:
-    """Create a JsonStore with test settings."""
+def test_store_disk(test_settings: Settings) -> JsonStore:
+    """Create a JsonStore that persists to the temp data directory."""
     return JsonStore(settings=test_settings)
 
 
 @pytest.fixture
-def sample_paper() -> Paper:
+def paper_service(test_store: JsonStore) -> PaperService:
+    """Create a PaperService backed by the test store."""
+    return PaperService(test_store)
+
+
+@pytest.fixture
+def milestone_service(test_store: JsonStore) -> MilestoneService:
+    """Create a MilestoneService backed by the test store."""
+    return MilestoneService(test_store)
+
+
+@pytest.fixture
+def task_service(test_store: JsonStore) -> TaskService:
+    """Create a TaskService backed by the test store."""
+    return TaskService(test_store)
+
+
+@pytest.fixture
+def paper_with_milestone(
+    paper_service: PaperService,
+    milestone_service: MilestoneService,
+    today: date,
+) -> Tuple[Paper, Milestone]:
+    """Create a stored paper with one milestone under it.
+
+    Task-layer tests need this graph in place but don't assert on it,
+    so it's built once here instead of in every test body.
+    """
+    paper = paper_service.create(name='Test', deadline=today)
+    milestone = milestone_service.create(paper.id, 'Milestone', today)
+    return paper, milestone
+
+
+@pytest.fixture
+def paper_factory(today: date) -> Callable[..., Paper]:
+    """Build Paper instances with default name and deadline filled in."""
+
+    def _make(**kwargs: object) -> Paper:
+        return Paper(**{'name': 'Test', 'deadline': today, **kwargs})
+
+    return _make
+
+
+@pytest.fixture
+def sample_paper(today: date) -> Paper:
     """Create a sample paper."""
     return Paper(
         id=uuid4(),
         name='Test Paper',
-        deadline=date.today() + timedelta(days=30),
+        deadline=today + timedelta(days=30),
         description='A test paper for unit testing',
     )
 
 
 @pytest.fixture
-def sample_milestone(sample_paper: Paper) -> Milestone:
+def sample_milestone(sample_paper: Paper, today: date) -> Milestone:
     """Create a sample milestone."""
     return Milestone(
         id=uuid4(),
         paper_id=sample_paper.id,
         description='Write introduction',
-        due_date=date.today() + timedelta(days=14),
+        due_date=today + timedelta(days=14),
         priority=2,
     )
 
 
 @pytest.fixture
-def sample_task(sample_paper: Paper, sample_milestone: Milestone) -> Task:
+def sample_task(sample_paper: Paper, sample_milestone: Milestone, today: date) -> Task:
     """Create a sample task."""
     return Task(
         id=uuid4(),
         milestone_id=sample_milestone.id,
         paper_id=sample_paper.id,
         description='Draft introduction outline',
-        scheduled_date=date.today(),
+        scheduled_date=today,
         estimated_hours=2.0,
     )
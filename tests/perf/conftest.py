@@ -0,0 +1,33 @@
+"""Collection gate for the micro-benchmarks.
+
+The benchmarks take several times longer than the rest of the suite, so
+they only run when explicitly requested via pytest-benchmark's
+--benchmark-only (or --benchmark-enable) flag.
+"""
+
+from pathlib import Path
+from typing import List
+
+import pytest
+
+_PERF_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: List[pytest.Item]
+) -> None:
+    """Skip benchmark tests unless a benchmark run was requested."""
+    try:
+        requested = config.getoption('--benchmark-only') or config.getoption(
+            '--benchmark-enable'
+        )
+    except ValueError:
+        # pytest-benchmark not installed; importorskip already skips the module
+        return
+    if requested:
+        return
+
+    skip = pytest.mark.skip(reason='benchmarks run only with --benchmark-only')
+    for item in items:
+        if _PERF_DIR in Path(str(item.fspath)).parents:
+            item.add_marker(skip)
@@ -0,0 +1,80 @@
+"""Micro-benchmarks for the hot read paths.
+
+Run with `pytest tests/perf --benchmark-only`; default runs skip these
+(see conftest.py here) and the module is skipped entirely when
+pytest-benchmark is not installed, so the regular suite stays fast.
+"""
+
+from datetime import date, timedelta
+from typing import Callable
+
+import pytest
+
+from paper_bartender.models.milestone import Milestone
+from paper_bartender.models.paper import Paper
+from paper_bartender.models.storage import StorageData
+from paper_bartender.models.task import Task
+from paper_bartender.services.paper_service import PaperService
+from paper_bartender.services.task_service import TaskService
+from paper_bartender.storage.json_store import InMemoryBackend, JsonStore
+from paper_bartender.utils.dates import parse_date
+
+pytest.importorskip('pytest_benchmark')
+
+_NUM_PAPERS = 10_000
+_NUM_TASKS = 10_000
+
+
+@pytest.fixture(scope='module')
+def populated_store(today: date) -> JsonStore:
+    """An in-memory store with 10k papers and 10k tasks over 365 dates.
+
+    Built as one StorageData and saved once — going through the service
+    create calls would serialize the whole document per object.
+    """
+    papers = [
+        Paper(name=f'Paper {i}', deadline=today + timedelta(days=i % 365))
+        for i in range(_NUM_PAPERS)
+    ]
+    milestone = Milestone(
+        paper_id=papers[0].id,
+        description='Milestone',
+        due_date=today + timedelta(days=30),
+    )
+    tasks = [
+        Task(
+            milestone_id=milestone.id,
+            paper_id=papers[0].id,
+            description=f'Task {i}',
+            scheduled_date=today + timedelta(days=i % 365),
+        )
+        for i in range(_NUM_TASKS)
+    ]
+
+    store = JsonStore(backend=InMemoryBackend())
+    store.save(StorageData(papers=papers, milestones=[milestone], tasks=tasks))
+    return store
+
+
+@pytest.mark.parametrize(
+    'text',
+    ['today', 'in 5 days', 'in 2 weeks', '5/10', '2025-05-10'],
+    ids=['today', 'in_days', 'in_weeks', 'short', 'iso'],
+)
+def test_parse_date_bench(benchmark: Callable, text: str) -> None:
+    """Benchmark parse_date over its supported forms."""
+    benchmark(parse_date, text)
+
+
+def test_list_all_bench(benchmark: Callable, populated_store: JsonStore) -> None:
+    """Benchmark PaperService.list_all with 10k papers."""
+    service = PaperService(populated_store)
+    result = benchmark(service.list_all)
+    assert len(result) == _NUM_PAPERS
+
+
+def test_get_today_bench(benchmark: Callable, populated_store: JsonStore) -> None:
+    """Benchmark TaskService.get_today with 10k tasks across 365 dates."""
+    service = TaskService(populated_store)
+    result = benchmark(service.get_today)
+    assert result
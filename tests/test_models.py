@@ -1,6 +1,7 @@
 """Tests for data models."""
 
 from datetime import date, timedelta
+from typing import Callable
 from uuid import UUID
 
 import pytest
@@ -14,68 +15,91 @@ from paper_bartender.models.task import Task, TaskStatus
 class TestPaper:
     """Tests for Paper model."""
 
-    def test_create_paper(self) -> None:
-        """Test creating a paper."""
-        paper = Paper(
-            name='My Research Paper',
-            deadline=date.today() + timedelta(days=30),
-        )
-        assert paper.name == 'My Research Paper'
+    @pytest.mark.parametrize(
+        'kwargs,expected_description',
+        [
+            ({'name': 'My Research Paper', 'description': 'A study'}, 'A study'),
+            ({}, None),
+        ],
+        ids=['explicit', 'defaults'],
+    )
+    def test_paper(
+        self,
+        paper_factory: Callable[..., Paper],
+        kwargs: dict,
+        expected_description: str,
+    ) -> None:
+        """Test paper construction and default values."""
+        paper = paper_factory(**kwargs)
+        assert paper.name == kwargs.get('name', 'Test')
+        assert paper.description == expected_description
         assert paper.archived is False
         assert isinstance(paper.id, UUID)
 
-    def test_paper_defaults(self) -> None:
-        """Test paper default values."""
-        paper = Paper(
-            name='Test',
-            deadline=date.today(),
-        )
-        assert paper.description is None
-        assert paper.archived is False
-
 
 class TestMilestone:
     """Tests for Milestone model."""
 
-    def test_create_milestone(self, sample_paper: Paper) -> None:
+    def test_create_milestone(self, sample_paper: Paper, today: date) -> None:
         """Test creating a milestone."""
         milestone = Milestone(
             paper_id=sample_paper.id,
             description='Finish experiments',
-            due_date=date.today() + timedelta(days=7),
+            due_date=today + timedelta(days=7),
         )
         assert milestone.description == 'Finish experiments'
         assert milestone.status == MilestoneStatus.PENDING
         assert milestone.decomposed is False
 
-    def test_milestone_status_values(self) -> None:
-        """Test milestone status enum values."""
-        assert MilestoneStatus.PENDING.value == 'pending'
-        assert MilestoneStatus.IN_PROGRESS.value == 'in_progress'
-        assert MilestoneStatus.COMPLETED.value == 'completed'
-
 
 class TestTask:
     """Tests for Task model."""
 
-    def test_create_task(self, sample_paper: Paper, sample_milestone: Milestone) -> None:
+    def test_create_task(
+        self, sample_paper: Paper, sample_milestone: Milestone, today: date
+    ) -> None:
         """Test creating a task."""
         task = Task(
             milestone_id=sample_milestone.id,
             paper_id=sample_paper.id,
             description='Write abstract',
-            scheduled_date=date.today(),
+            scheduled_date=today,
             estimated_hours=2.0,
         )
         assert task.description == 'Write abstract'
         assert task.status == TaskStatus.PENDING
         assert task.estimated_hours == 2.0
 
-    def test_task_status_values(self) -> None:
-        """Test task status enum values."""
-        assert TaskStatus.PENDING.value == 'pending'
-        assert TaskStatus.COMPLETED.value == 'completed'
-        assert TaskStatus.SKIPPED.value == 'skipped'
+
+class TestStatusEnums:
+    """Tests for status enum values."""
+
+    @pytest.mark.parametrize(
+        'enum_cls,expected',
+        [
+            (
+                MilestoneStatus,
+                {
+                    'PENDING': 'pending',
+                    'IN_PROGRESS': 'in_progress',
+                    'COMPLETED': 'completed',
+                },
+            ),
+            (
+                TaskStatus,
+                {
+                    'PENDING': 'pending',
+                    'IN_PROGRESS': 'in_progress',
+                    'COMPLETED': 'completed',
+                    'SKIPPED': 'skipped',
+                },
+            ),
+        ],
+        ids=['milestone', 'task'],
+    )
+    def test_enum_values(self, enum_cls: type, expected: dict) -> None:
+        """Test that each status enum holds exactly the expected members."""
+        assert {e.name: e.value for e in enum_cls} == expected
 
 
 class TestStorageData:
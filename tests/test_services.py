@@ -1,129 +1,164 @@
 """Tests for services."""
 
+import re
 from datetime import date, timedelta
-from pathlib import Path
+from typing import Tuple
+from uuid import uuid4
 
 import pytest
 
-from paper_bartender.config.settings import Settings
-from paper_bartender.models.milestone import MilestoneStatus
+from paper_bartender.models.milestone import Milestone, MilestoneStatus
+from paper_bartender.models.paper import Paper
 from paper_bartender.models.task import TaskStatus
 from paper_bartender.services.milestone_service import MilestoneService
 from paper_bartender.services.paper_service import PaperService
 from paper_bartender.services.task_service import TaskService
 from paper_bartender.storage.json_store import JsonStore
 
+# An ID that never matches a stored paper
+_BOGUS_PAPER_ID = uuid4()
+
+# Compiled once; pytest.raises(match=...) accepts pre-compiled patterns
+_ALREADY_EXISTS = re.compile('already exists')
+_NOT_FOUND = re.compile('not found')
+
 
 class TestPaperService:
     """Tests for PaperService."""
 
-    def test_create_paper(self, test_store: JsonStore) -> None:
+    def test_create_paper(self, paper_service: PaperService, today: date) -> None:
         """Test creating a paper."""
-        service = PaperService(test_store)
-        paper = service.create(
+        paper = paper_service.create(
             name='Test Paper',
-            deadline=date.today() + timedelta(days=30),
+            deadline=today + timedelta(days=30),
         )
         assert paper.name == 'Test Paper'
 
-    def test_create_duplicate_paper(self, test_store: JsonStore) -> None:
+    def test_create_duplicate_paper(self, paper_service: PaperService, today: date) -> None:
         """Test creating a paper with duplicate name fails."""
-        service = PaperService(test_store)
-        service.create(name='Test Paper', deadline=date.today())
+        paper_service.create(name='Test Paper', deadline=today)
 
-        with pytest.raises(ValueError, match='already exists'):
-            service.create(name='Test Paper', deadline=date.today())
+        with pytest.raises(ValueError, match=_ALREADY_EXISTS):
+            paper_service.create(name='Test Paper', deadline=today)
 
-    def test_get_by_name(self, test_store: JsonStore) -> None:
+    def test_get_by_name(self, paper_service: PaperService, today: date) -> None:
         """Test getting a paper by name."""
-        service = PaperService(test_store)
-        created = service.create(name='Find Me', deadline=date.today())
+        created = paper_service.create(name='Find Me', deadline=today)
 
-        found = service.get_by_name('Find Me')
+        found = paper_service.get_by_name('Find Me')
         assert found is not None
         assert found.id == created.id
 
-    def test_get_by_name_case_insensitive(self, test_store: JsonStore) -> None:
+    def test_get_by_name_case_insensitive(
+        self, paper_service: PaperService, today: date
+    ) -> None:
         """Test that paper lookup is case-insensitive."""
-        service = PaperService(test_store)
-        service.create(name='My Paper', deadline=date.today())
+        paper_service.create(name='My Paper', deadline=today)
 
-        found = service.get_by_name('my paper')
+        found = paper_service.get_by_name('my paper')
         assert found is not None
         assert found.name == 'My Paper'
 
-    def test_list_papers(self, test_store: JsonStore) -> None:
+    def test_get_by_name_is_indexed(
+        self, paper_service: PaperService, test_store: JsonStore, today: date
+    ) -> None:
+        """Test that name lookups build a cached index that writes refresh."""
+        paper_service.create(name='My Paper', deadline=today)
+
+        assert paper_service.get_by_name('my paper') is not None
+        assert paper_service._by_lower is not None
+        assert 'my paper' in paper_service._by_lower
+
+        # A write through another service sharing the store bumps the
+        # store version, so the next lookup rebuilds the index
+        other_service = PaperService(test_store)
+        other_service.create(name='Other Paper', deadline=today)
+        assert paper_service.get_by_name('Other Paper') is not None
+
+    def test_list_papers(self, paper_service: PaperService, today: date) -> None:
         """Test listing papers."""
-        service = PaperService(test_store)
-        service.create(name='Paper 1', deadline=date.today() + timedelta(days=10))
-        service.create(name='Paper 2', deadline=date.today() + timedelta(days=5))
+        paper_service.create(name='Paper 1', deadline=today + timedelta(days=10))
+        paper_service.create(name='Paper 2', deadline=today + timedelta(days=5))
 
-        papers = service.list_all()
+        papers = paper_service.list_all()
         assert len(papers) == 2
         # Should be sorted by deadline
         assert papers[0].name == 'Paper 2'
 
-    def test_archive_paper(self, test_store: JsonStore) -> None:
+        # The sorted order is cached; the index itself holds the invariant
+        assert paper_service._by_deadline is not None
+        assert paper_service._by_deadline[0].name == 'Paper 2'
+
+    def test_archive_paper(self, paper_service: PaperService, today: date) -> None:
         """Test archiving a paper."""
-        service = PaperService(test_store)
-        paper = service.create(name='Archive Me', deadline=date.today())
+        paper = paper_service.create(name='Archive Me', deadline=today)
 
-        service.archive(paper.id)
-        papers = service.list_all(include_archived=False)
+        paper_service.archive(paper.id)
+        papers = paper_service.list_all(include_archived=False)
         assert len(papers) == 0
 
-        papers = service.list_all(include_archived=True)
+        papers = paper_service.list_all(include_archived=True)
         assert len(papers) == 1
 
 
 class TestMilestoneService:
     """Tests for MilestoneService."""
 
-    def test_create_milestone(self, test_store: JsonStore) -> None:
+    def test_create_milestone(
+        self,
+        paper_service: PaperService,
+        milestone_service: MilestoneService,
+        today: date,
+    ) -> None:
         """Test creating a milestone."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
+        paper = paper_service.create(name='Test', deadline=today)
 
-        milestone_service = MilestoneService(test_store)
         milestone = milestone_service.create(
             paper_id=paper.id,
             description='Write intro',
-            due_date=date.today() + timedelta(days=7),
+            due_date=today + timedelta(days=7),
         )
         assert milestone.description == 'Write intro'
         assert milestone.status == MilestoneStatus.PENDING
 
-    def test_create_milestone_invalid_paper(self, test_store: JsonStore) -> None:
+    def test_create_milestone_invalid_paper(
+        self, milestone_service: MilestoneService, today: date
+    ) -> None:
         """Test creating a milestone for non-existent paper fails."""
-        from uuid import uuid4
-
-        milestone_service = MilestoneService(test_store)
-        with pytest.raises(ValueError, match='not found'):
+        with pytest.raises(ValueError, match=_NOT_FOUND):
             milestone_service.create(
-                paper_id=uuid4(),
+                paper_id=_BOGUS_PAPER_ID,
                 description='Test',
-                due_date=date.today(),
+                due_date=today,
             )
 
-    def test_list_by_paper(self, test_store: JsonStore) -> None:
+    def test_list_by_paper(
+        self,
+        paper_service: PaperService,
+        milestone_service: MilestoneService,
+        test_store: JsonStore,
+        today: date,
+    ) -> None:
         """Test listing milestones by paper."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
+        paper = paper_service.create(name='Test', deadline=today)
 
-        milestone_service = MilestoneService(test_store)
-        milestone_service.create(paper.id, 'Task 1', date.today())
-        milestone_service.create(paper.id, 'Task 2', date.today())
+        with test_store.batch():
+            milestone_service.create(paper.id, 'Task 1', today)
+            milestone_service.create(paper.id, 'Task 2', today)
 
         milestones = milestone_service.list_by_paper(paper.id)
         assert len(milestones) == 2
 
-    def test_complete_milestone(self, test_store: JsonStore) -> None:
+    def test_complete_milestone(
+        self,
+        paper_service: PaperService,
+        milestone_service: MilestoneService,
+        today: date,
+    ) -> None:
         """Test completing a milestone."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
+        paper = paper_service.create(name='Test', deadline=today)
 
-        milestone_service = MilestoneService(test_store)
-        milestone = milestone_service.create(paper.id, 'Task', date.today())
+        milestone = milestone_service.create(paper.id, 'Task', today)
 
         completed = milestone_service.complete(milestone.id)
         assert completed.status == MilestoneStatus.COMPLETED
@@ -132,71 +167,79 @@ class TestMilestoneService:
 class TestTaskService:
     """Tests for TaskService."""
 
-    def test_create_task(self, test_store: JsonStore) -> None:
+    def test_create_task(
+        self,
+        paper_with_milestone: Tuple[Paper, Milestone],
+        task_service: TaskService,
+        today: date,
+    ) -> None:
         """Test creating a task."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
+        paper, milestone = paper_with_milestone
 
-        milestone_service = MilestoneService(test_store)
-        milestone = milestone_service.create(paper.id, 'Milestone', date.today())
-
-        task_service = TaskService(test_store)
         task = task_service.create(
             milestone_id=milestone.id,
             paper_id=paper.id,
             description='Do something',
-            scheduled_date=date.today(),
+            scheduled_date=today,
             estimated_hours=2.0,
         )
         assert task.description == 'Do something'
         assert task.estimated_hours == 2.0
 
-    def test_get_today(self, test_store: JsonStore) -> None:
+    def test_get_today(
+        self,
+        paper_with_milestone: Tuple[Paper, Milestone],
+        task_service: TaskService,
+        test_store: JsonStore,
+        today: date,
+    ) -> None:
         """Test getting today's tasks."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
-
-        milestone_service = MilestoneService(test_store)
-        milestone = milestone_service.create(paper.id, 'Milestone', date.today())
+        paper, milestone = paper_with_milestone
 
-        task_service = TaskService(test_store)
-        task_service.create(milestone.id, paper.id, 'Today task', date.today())
-        task_service.create(
-            milestone.id, paper.id, 'Tomorrow task', date.today() + timedelta(days=1)
-        )
+        with test_store.batch():
+            task_service.create(milestone.id, paper.id, 'Today task', today)
+            task_service.create(
+                milestone.id, paper.id, 'Tomorrow task', today + timedelta(days=1)
+            )
 
         today_tasks = task_service.get_today()
         assert len(today_tasks) == 1
         assert today_tasks[0].description == 'Today task'
 
-    def test_get_overdue(self, test_store: JsonStore) -> None:
+    def test_get_overdue(
+        self,
+        paper_with_milestone: Tuple[Paper, Milestone],
+        task_service: TaskService,
+        test_store: JsonStore,
+        today: date,
+    ) -> None:
         """Test getting overdue tasks."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
+        paper, milestone = paper_with_milestone
 
-        milestone_service = MilestoneService(test_store)
-        milestone = milestone_service.create(paper.id, 'Milestone', date.today())
-
-        task_service = TaskService(test_store)
-        task_service.create(
-            milestone.id, paper.id, 'Overdue', date.today() - timedelta(days=1)
-        )
-        task_service.create(milestone.id, paper.id, 'Today', date.today())
+        with test_store.batch():
+            task_service.create(
+                milestone.id, paper.id, 'Overdue', today - timedelta(days=1)
+            )
+            task_service.create(
+                milestone.id, paper.id, 'Older overdue', today - timedelta(days=3)
+            )
+            task_service.create(milestone.id, paper.id, 'Today', today)
 
         overdue = task_service.get_overdue()
-        assert len(overdue) == 1
-        assert overdue[0].description == 'Overdue'
-
-    def test_complete_task(self, test_store: JsonStore) -> None:
+        assert len(overdue) == 2
+        # Oldest scheduled date comes first
+        assert [t.description for t in overdue] == ['Older overdue', 'Overdue']
+
+    def test_complete_task(
+        self,
+        paper_with_milestone: Tuple[Paper, Milestone],
+        task_service: TaskService,
+        today: date,
+    ) -> None:
         """Test completing a task."""
-        paper_service = PaperService(test_store)
-        paper = paper_service.create(name='Test', deadline=date.today())
-
-        milestone_service = MilestoneService(test_store)
-        milestone = milestone_service.create(paper.id, 'Milestone', date.today())
+        paper, milestone = paper_with_milestone
 
-        task_service = TaskService(test_store)
-        task = task_service.create(milestone.id, paper.id, 'Task', date.today())
+        task = task_service.create(milestone.id, paper.id, 'Task', today)
 
         completed = task_service.complete(task.id)
         assert completed.status == TaskStatus.COMPLETED
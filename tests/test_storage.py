@@ -0,0 +1,35 @@
+"""Tests for JSON storage."""
+
+from paper_bartender.config.settings import Settings
+from paper_bartender.models.paper import Paper
+from paper_bartender.models.storage import StorageData
+from paper_bartender.storage.json_store import JsonStore
+
+
+class TestJsonStore:
+    """Tests for JsonStore persistence."""
+
+    def test_disk_round_trip(
+        self,
+        test_store_disk: JsonStore,
+        test_settings: Settings,
+        sample_paper: Paper,
+    ) -> None:
+        """Test that saved data survives a fresh store instance."""
+        test_store_disk.save(StorageData(papers=[sample_paper]))
+
+        reloaded = JsonStore(settings=test_settings).load()
+        assert len(reloaded.papers) == 1
+        assert reloaded.papers[0].id == sample_paper.id
+
+    def test_in_memory_store_leaves_disk_alone(
+        self,
+        test_store: JsonStore,
+        test_settings: Settings,
+        sample_paper: Paper,
+    ) -> None:
+        """Test that the in-memory store never touches the data file."""
+        test_store.save(StorageData(papers=[sample_paper]))
+
+        assert not test_settings.data_path.exists()
+        assert len(test_store.load().papers) == 1